@@ -22,17 +22,11 @@ class Discord(Webhook):
         self._retries = 1
         self._retry_delay = 0.1
         self._timeout = self._config["discord"].get("timeout", 10)
-
-    def cleanup(self) -> None:
-        """
-        Cleanup pending module resources.
-        This will do nothing for webhooks, they will simply not be called anymore
-        """
-        pass
+        self._init_sender()
 
     def send_msg(self, msg) -> None:
         if fields := self._config["discord"].get(msg["type"].value):
-            logger.info(f"Sending discord message: {msg}")
+            logger.debug("Sending discord message: %s", msg)
 
             msg["strategy"] = self.strategy
             msg["timeframe"] = self.timeframe
@@ -58,4 +52,4 @@ class Discord(Webhook):
 
             # Send the message to discord channel
             payload = {"embeds": embeds}
-            self._send_msg(payload)
+            self._queue_msg(payload)
@@ -4,9 +4,12 @@ This module manages webhook communication
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from typing import Any
 
-from requests import RequestException, post
+from requests import RequestException, Session
+from requests.adapters import HTTPAdapter
 
 from freqtrade.constants import Config
 from freqtrade.enums import RPCMessageType
@@ -18,6 +21,9 @@ logger = logging.getLogger(__name__)
 
 logger.debug("Included module rpc.webhook ...")
 
+# Warn every time this many more messages are waiting to be sent
+QUEUE_WARNING_SIZE = 100
+
 
 class Webhook(RPCHandler):
     """This class handles all webhook communication"""
@@ -36,13 +42,28 @@ class Webhook(RPCHandler):
         self._retries = self._config["webhook"].get("retries", 0)
         self._retry_delay = self._config["webhook"].get("retry_delay", 0.1)
         self._timeout = self._config["webhook"].get("timeout", 10)
+        self._init_sender()
+
+    def _init_sender(self) -> None:
+        """
+        Create a keep-alive session, so consecutive messages reuse the same connection
+        instead of paying the TCP / TLS handshake for every message.
+        Messages are sent from a single background worker, which keeps them in order.
+        The queue is unbounded, a warning is logged when messages pile up.
+        """
+        self._session = Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="webhook")
+        self._pending = 0
+        self._pending_lock = Lock()
 
     def cleanup(self) -> None:
         """
         Cleanup pending module resources.
-        This will do nothing for webhooks, they will simply not be called anymore
+        Waits for queued messages to be sent, then closes the pooled connections.
         """
-        pass
+        self._executor.shutdown(wait=True)
+        self._session.close()
 
     def _get_value_dict(self, msg: RPCSendMsg) -> dict[str, Any] | None:
         whconfig = self._config["webhook"]
@@ -91,7 +112,7 @@ class Webhook(RPCHandler):
                 return
 
             payload = {key: value.format(**msg) for (key, value) in valuedict.items()}
-            self._send_msg(payload)
+            self._queue_msg(payload)
         except KeyError as exc:
             logger.exception(
                 "Problem calling Webhook. Please check your webhook configuration. "
@@ -99,6 +120,34 @@ class Webhook(RPCHandler):
                 exc,
             )
 
+    def _queue_msg(self, payload: dict) -> None:
+        """
+        Hand the message to the background worker,
+        so network latency and retries don't block the calling thread.
+        """
+        with self._pending_lock:
+            self._pending += 1
+            pending = self._pending
+        if pending % QUEUE_WARNING_SIZE == 0:
+            logger.warning(
+                "%s messages waiting to be sent by rpc.%s. Please check the endpoint.",
+                pending,
+                self.name,
+            )
+        self._executor.submit(self._send_msg_background, payload)
+
+    def _send_msg_background(self, payload: dict) -> None:
+        """Log worker exceptions, as they can no longer reach RPCManager.send_msg"""
+        try:
+            self._send_msg(payload)
+        except NotImplementedError as exc:
+            logger.error("%s not implemented by handler %s.", exc, self.name)
+        except Exception:
+            logger.exception("Exception occurred while sending message to rpc.%s", self.name)
+        finally:
+            with self._pending_lock:
+                self._pending -= 1
+
     def _send_msg(self, payload: dict) -> None:
         """do the actual call to the webhook"""
 
@@ -114,11 +163,11 @@ class Webhook(RPCHandler):
 
             try:
                 if self._format == "form":
-                    response = post(self._url, data=payload, timeout=self._timeout)
+                    response = self._session.post(self._url, data=payload, timeout=self._timeout)
                 elif self._format == "json":
-                    response = post(self._url, json=payload, timeout=self._timeout)
+                    response = self._session.post(self._url, json=payload, timeout=self._timeout)
                 elif self._format == "raw":
-                    response = post(
+                    response = self._session.post(
                         self._url,
                         data=payload["data"],
                         headers={"Content-Type": "text/plain"},
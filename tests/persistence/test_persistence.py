@@ -1915,7 +1915,6 @@ def test_get_trades_backtest():
 
 
 @pytest.mark.usefixtures("init_persistence")
-# @pytest.mark.parametrize('is_short', [True, False])
 def test_get_overall_performance(fee):
     create_mock_trades(fee, False)
     res = Trade.get_overall_performance()
@@ -4,13 +4,23 @@ import logging
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 
-from requests import RequestException
+import pytest
+from requests import RequestException, Session
 
 from freqtrade.enums import ExitType, RPCMessageType
 from freqtrade.rpc import RPC
 from freqtrade.rpc.discord import Discord
-from freqtrade.rpc.webhook import Webhook
-from tests.conftest import get_patched_freqtradebot, log_has
+from freqtrade.rpc.webhook import QUEUE_WARNING_SIZE, Webhook
+from tests.conftest import get_patched_freqtradebot, log_has, log_has_re
+
+
+@pytest.fixture
+def sync_executor(mocker):
+    """Send queued messages immediately, so calls can be asserted right away."""
+    executor = MagicMock()
+    executor.submit.side_effect = lambda fn, *args: fn(*args)
+    mocker.patch("freqtrade.rpc.webhook.ThreadPoolExecutor", return_value=executor)
+    return executor
 
 
 def get_webhook_dict() -> dict:
@@ -63,10 +73,64 @@ def get_webhook_dict() -> dict:
 
 def test__init__(mocker, default_conf):
     default_conf["webhook"] = {"enabled": True, "url": "https://DEADBEEF.com"}
+    adapter_mock = mocker.patch("freqtrade.rpc.webhook.HTTPAdapter")
     webhook = Webhook(RPC(get_patched_freqtradebot(mocker, default_conf)), default_conf)
     assert webhook._config == default_conf
+    assert isinstance(webhook._session, Session)
+    # Single pooled connection, matching the single sender worker
+    adapter_mock.assert_called_once_with(pool_connections=1, pool_maxsize=1)
+    assert webhook._session.adapters["https://"] is adapter_mock.return_value
+
+
+def test_cleanup(mocker, default_conf):
+    default_conf["webhook"] = {"enabled": True, "url": "https://DEADBEEF.com"}
+    webhook = Webhook(RPC(get_patched_freqtradebot(mocker, default_conf)), default_conf)
+    close_mock = mocker.patch.object(webhook._session, "close")
+    post = mocker.patch.object(webhook._session, "post")
+    webhook._queue_msg({"value1": "DEADBEEF"})
+    webhook.cleanup()
+    # Queued messages are sent before the session is closed
+    assert post.call_count == 1
+    assert close_mock.call_count == 1
+
+
+def test_queue_msg_exception(mocker, default_conf, caplog):
+    default_conf["webhook"] = {"enabled": True, "url": "https://DEADBEEF.com"}
+    webhook = Webhook(RPC(get_patched_freqtradebot(mocker, default_conf)), default_conf)
+    send_mock = mocker.patch.object(
+        webhook, "_send_msg", side_effect=NotImplementedError("Unknown format: DEADBEEF")
+    )
+    webhook._queue_msg({"value1": "DEADBEEF"})
+    send_mock.side_effect = ValueError
+    webhook._queue_msg({"value1": "DEADBEEF"})
+    webhook.cleanup()
+    assert log_has("Unknown format: DEADBEEF not implemented by handler webhook.", caplog)
+    assert log_has("Exception occurred while sending message to rpc.webhook", caplog)
+
+
+def test_queue_msg_backlog_warning(mocker, default_conf, caplog):
+    default_conf["webhook"] = {"enabled": True, "url": "https://DEADBEEF.com"}
+    webhook = Webhook(RPC(get_patched_freqtradebot(mocker, default_conf)), default_conf)
+    # Nothing gets sent, so every queued message stays pending
+    webhook._executor = MagicMock()
+    for _ in range(QUEUE_WARNING_SIZE - 1):
+        webhook._queue_msg({"value1": "DEADBEEF"})
+    assert not log_has_re(r".* messages waiting to be sent by rpc\.webhook.*", caplog)
+    webhook._queue_msg({"value1": "DEADBEEF"})
+    assert log_has(
+        f"{QUEUE_WARNING_SIZE} messages waiting to be sent by rpc.webhook. "
+        "Please check the endpoint.",
+        caplog,
+    )
+    assert webhook._executor.submit.call_count == QUEUE_WARNING_SIZE
+
+    # The counter drops again once messages are sent
+    webhook._send_msg = MagicMock()
+    webhook._send_msg_background({"value1": "DEADBEEF"})
+    assert webhook._pending == QUEUE_WARNING_SIZE - 1
 
 
+@pytest.mark.usefixtures("sync_executor")
 def test_send_msg_webhook(default_conf, mocker):
     default_conf["webhook"] = get_webhook_dict()
     msg_mock = MagicMock()
@@ -362,6 +426,7 @@ def test_send_msg_webhook(default_conf, mocker):
         ].format(**msg)
 
 
+@pytest.mark.usefixtures("sync_executor")
 def test_exception_send_msg(default_conf, mocker, caplog):
     caplog.set_level(logging.DEBUG)
     default_conf["webhook"] = get_webhook_dict()
@@ -404,7 +469,7 @@ def test__send_msg(default_conf, mocker, caplog):
     webhook = Webhook(RPC(get_patched_freqtradebot(mocker, default_conf)), default_conf)
     msg = {"value1": "DEADBEEF", "value2": "ALIVEBEEF", "value3": "FREQTRADE"}
     post = MagicMock()
-    mocker.patch("freqtrade.rpc.webhook.post", post)
+    mocker.patch.object(webhook._session, "post", post)
     webhook._send_msg(msg)
 
     assert post.call_count == 1
@@ -412,7 +477,7 @@ def test__send_msg(default_conf, mocker, caplog):
     assert post.call_args[0] == (default_conf["webhook"]["url"],)
 
     post = MagicMock(side_effect=RequestException)
-    mocker.patch("freqtrade.rpc.webhook.post", post)
+    mocker.patch.object(webhook._session, "post", post)
     webhook._send_msg(msg)
     assert log_has("Could not call webhook url. Exception: ", caplog)
 
@@ -423,7 +488,7 @@ def test__send_msg_with_json_format(default_conf, mocker, caplog):
     webhook = Webhook(RPC(get_patched_freqtradebot(mocker, default_conf)), default_conf)
     msg = {"text": "Hello"}
     post = MagicMock()
-    mocker.patch("freqtrade.rpc.webhook.post", post)
+    mocker.patch.object(webhook._session, "post", post)
     webhook._send_msg(msg)
 
     assert post.call_args[1] == {"json": msg, "timeout": 10}
@@ -435,7 +500,7 @@ def test__send_msg_with_raw_format(default_conf, mocker, caplog):
     webhook = Webhook(RPC(get_patched_freqtradebot(mocker, default_conf)), default_conf)
     msg = {"data": "Hello"}
     post = MagicMock()
-    mocker.patch("freqtrade.rpc.webhook.post", post)
+    mocker.patch.object(webhook._session, "post", post)
     webhook._send_msg(msg)
 
     assert post.call_args[1] == {
@@ -445,6 +510,7 @@ def test__send_msg_with_raw_format(default_conf, mocker, caplog):
     }
 
 
+@pytest.mark.usefixtures("sync_executor")
 def test_send_msg_discord(default_conf, mocker):
     default_conf["discord"] = {"enabled": True, "webhook_url": "https://webhookurl..."}
     msg_mock = MagicMock()